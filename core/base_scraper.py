@@ -1,19 +1,240 @@
+import asyncio
+import logging
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-from core.data_models import DealItem
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional
+from core.data_models import DealItem, Category
 from core.request_manager import RequestManager
 
+# Evaluated in the page: rendered markup and the URL the document ended up at
+_CONTENT_AND_URL_JS = '() => [document.documentElement.outerHTML, location.href]'
+
+# Strips currency symbols, separators and whitespace from price text
+PRICE_RE = re.compile(r'[^\d.]+')
+
+# Lower-cased category values looked for in product URLs
+_CATEGORY_URL_TOKENS = tuple((cat, cat.value.lower()) for cat in Category)
+
+# Title keywords per category, checked in order
+_CATEGORY_KEYWORDS = (
+    (Category.TV, ("tv", "televisor", "monitor", "led", "smart tv")),
+    (Category.PHONE, ("celular", "teléfono", "smartphone")),
+    (Category.LAPTOP, ("laptop", "computadora", "notebook")),
+    (Category.FRIDGE, ("nevera", "refrigerador")),
+    (Category.WASHING_MACHINE, ("lavadora",)),
+    (Category.AIR_CONDITIONER, ("aire acondicionado",)),
+    (Category.MICROWAVE, ("microonda",)),
+    (Category.STOVE, ("estufa", "cocina")),
+)
+
+# One zero-width scan over the title for every keyword; each hit names its
+# category group, so overlapping keywords are all still seen
+_CATEGORY_RE = re.compile("|".join(
+    f"(?=(?P<{category.name}>{'|'.join(map(re.escape, keywords))}))"
+    for category, keywords in _CATEGORY_KEYWORDS
+))
+
+@lru_cache(maxsize=1024)
+def infer_category(title: str, url: str) -> Category:
+    """Infer product category from title and URL; listings repeat titles, so results are cached"""
+    # First try from URL
+    url_lower = url.lower()
+    for cat, token in _CATEGORY_URL_TOKENS:
+        if token in url_lower:
+            return cat
+
+    # Then try from title
+    hits = {m.lastgroup for m in _CATEGORY_RE.finditer(title.lower())}
+    if hits:
+        for category, _ in _CATEGORY_KEYWORDS:
+            if category.name in hits:
+                return category
+
+    return Category.TV  # Default category
+
+class PreparedFilters(NamedTuple):
+    """Scrape filters normalized once per scrape() so per-product checks are plain compares"""
+    brands_lower: Optional[FrozenSet[str]] = None
+    condition: Any = None
+    location_lower: Optional[str] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    
+    @classmethod
+    def from_dict(cls, filters: Dict) -> "PreparedFilters":
+        brands = filters.get("brand")
+        if isinstance(brands, str):
+            brands = [brands]
+        location = filters.get("location")
+        price_range = filters.get("price_range") or {}
+        return cls(
+            brands_lower=frozenset(b.lower() for b in brands) if "brand" in filters else None,
+            condition=filters.get("condition"),
+            location_lower=location.lower() if location is not None else None,
+            min_price=price_range.get("min"),
+            max_price=price_range.get("max"),
+        )
+
 class BaseScraper(ABC):
+    BASE_URL: str = ""
+    # Category filter value -> path appended to BASE_URL
+    CATEGORY_PATHS: Dict[str, str] = {}
+    
+    # Sites whose listings render without JavaScript can set this to False
+    # so fetch_html() skips the browser entirely
+    needs_js: bool = True
+    
     def __init__(self, request_manager: Optional[RequestManager] = None):
+        # A scraper built without a shared manager owns its browser and closes it in close()
+        self._owns_request_manager = request_manager is None
         self.request_manager = request_manager or RequestManager()
+        # Screenshots, page dumps and DEBUG logging are opt-in via SCRAPER_DEBUG=1
+        self.debug = os.getenv('SCRAPER_DEBUG') == '1'
+        self.logger = logging.getLogger(type(self).__module__)
+    
+    async def close(self):
+        """Shut down the browser if this scraper launched it; shared managers are left to their owner"""
+        if self._owns_request_manager:
+            await self.request_manager.close()
+    
+    async def __aenter__(self) -> "BaseScraper":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def fetch_html(self, url: str) -> str:
+        """Fetch a page's HTML, going through the browser only when the site needs JavaScript"""
+        if not self.needs_js:
+            return await self.request_manager.get_html(url)
+        page = await self.request_manager.get(url)
+        try:
+            self.logger.debug("Page fetched successfully")
+            await self._prepare_page(page)
+            
+            # Markup and in-page URL (to spot redirects or blocks) in one round trip
+            content, current_url = await page.evaluate(_CONTENT_AND_URL_JS)
+            self.logger.debug("Current URL after load: %s", current_url)
+            
+            # Take a screenshot for debugging
+            if self.debug:
+                await page.screenshot(path="debug_screenshot.png")
+                self.logger.debug("Screenshot saved as debug_screenshot.png")
+            return content
+        finally:
+            await self.request_manager.release_page(page)
+    
+    async def _prepare_page(self, page):
+        """Hook run on a loaded browser page before its HTML is read, e.g. to scroll in lazy-loaded items"""
+        pass
+    
+    def _matches_filters(self, item: DealItem, filters: PreparedFilters) -> bool:
+        """Check if item matches all specified filters"""
+        self.logger.debug("Checking filters for item: %s", item.title)
+        self.logger.debug("Applied filters: %s", filters)
+        
+        # Brand filter check, case insensitive
+        if filters.brands_lower is not None:
+            if item.brand_lower not in filters.brands_lower:
+                self.logger.debug("Brand mismatch. Item brand: %s, Filter brands: %s", item.brand, filters.brands_lower)
+                return False
+            else:
+                self.logger.debug("Brand match found for %s", item.brand)
+                
+        if filters.condition is not None and item.condition != filters.condition:
+            self.logger.debug("Condition mismatch. Item: %s, Filter: %s", item.condition, filters.condition)
+            return False
+            
+        if filters.location_lower is not None and filters.location_lower not in item.location.lower():
+            self.logger.debug("Location mismatch. Item: %s, Filter: %s", item.location, filters.location_lower)
+            return False
+            
+        if filters.min_price is not None and item.price < filters.min_price:
+            self.logger.debug("Price below minimum. Item: %s, Min: %s", item.price, filters.min_price)
+            return False
+        if filters.max_price is not None and item.price > filters.max_price:
+            self.logger.debug("Price above maximum. Item: %s, Max: %s", item.price, filters.max_price)
+            return False
+                
+        self.logger.debug("Item matches all filters")
+        return True
     
-    @abstractmethod
     async def scrape(self, filters: Dict) -> List[DealItem]:
-        """Main scraping method to be implemented by each site scraper"""
+        """Scrape every listing the filters ask for and return the matching deals"""
+        urls = self._build_urls(filters)
+        prepared = PreparedFilters.from_dict(filters)
+        if len(urls) == 1:
+            return await self._scrape_one(urls[0], prepared)
+        
+        # One listing per requested category. At most one per pooled browser
+        # context is in flight; the manager still spaces their navigations out.
+        semaphore = asyncio.Semaphore(self.request_manager.pool_size)
+        batches = await asyncio.gather(*(self._guarded(semaphore, url, prepared) for url in urls))
+        results = [item for batch in batches for item in batch]
+        self.logger.info("Scraped %s category pages. Found %s matching products", len(urls), len(results))
+        return results
+    
+    async def _guarded(self, semaphore: asyncio.Semaphore, url: str, filters: PreparedFilters) -> List[DealItem]:
+        async with semaphore:
+            return await self._scrape_one(url, filters)
+    
+    async def _scrape_one(self, url: str, filters: PreparedFilters) -> List[DealItem]:
+        results = []
+        
+        try:
+            self.logger.info("Starting scrape for URL: %s", url)
+            
+            content = await self.fetch_html(url)
+            self.logger.debug("Page content length: %s", len(content))
+            if self.debug:
+                self.logger.debug("First 1000 characters of content: %s", content[:1000])
+            
+            # Parsing is CPU-bound; keep it off the event loop so other
+            # scrapers' page loads make progress meanwhile
+            results = await asyncio.to_thread(self._parse_content, content, filters)
+            
+            self.logger.info("Scraping completed. Found %s matching products", len(results))
+            
+        except Exception as e:
+            self.logger.error("Error during scraping: %s", e, exc_info=True)
+            
+        return results
+    
+    @abstractmethod
+    def _parse_content(self, content: str, filters: PreparedFilters) -> List[DealItem]:
+        """Parse a listing page and return the products matching the filters, to be implemented by each site scraper"""
         pass
+    
+    def _build_urls(self, filters: Dict) -> List[str]:
+        """Build one listing URL per requested category"""
+        categories = filters.get("category")
+        if categories is None:
+            return [self.BASE_URL]
+        if isinstance(categories, str):
+            categories = [categories]
+        
+        # Unknown categories fall back to the base listing; keep each URL once
+        return list(dict.fromkeys(
+            self.BASE_URL + self._get_category_path(category) for category in categories
+        )) or [self.BASE_URL]
+    
+    def _get_category_path(self, category: str) -> str:
+        """Map category to website path"""
+        return self.CATEGORY_PATHS.get(category, "")
 
     @staticmethod
     @abstractmethod
     def get_supported_filters() -> Dict:
         """Return supported filters for this scraper"""
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get_supported_filter_sets(cls) -> Dict:
+        """Supported filters with value lists frozen into sets, computed once per scraper class"""
+        return {
+            key: frozenset(value) if isinstance(value, list) else value
+            for key, value in cls.get_supported_filters().items()
+        }
\ No newline at end of file
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from typing import Optional, List, Dict, FrozenSet
 from enum import Enum
 from datetime import datetime
 import re
@@ -17,20 +17,22 @@ class Category(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "Category":
         """Convert string to category, handling common variations"""
-        value = value.lower().strip()
-        mapping = {
-            "television": cls.TV,
-            "smartphone": cls.PHONE,
-            "mobile": cls.PHONE,
-            "notebook": cls.LAPTOP,
-            "refrigerator": cls.FRIDGE,
-            "nevera": cls.FRIDGE,
-            "lavadora": cls.WASHING_MACHINE,
-            "aire acondicionado": cls.AIR_CONDITIONER,
-            "microondas": cls.MICROWAVE,
-            "estufa": cls.STOVE,
-        }
-        return mapping.get(value, next((c for c in cls if c.value.lower() == value), None))
+        return cls._LOOKUP.get(value.lower().strip())
+
+# Lower-cased values plus common variations, built once at import
+Category._LOOKUP = {
+    **{c.value.lower(): c for c in Category},
+    "television": Category.TV,
+    "smartphone": Category.PHONE,
+    "mobile": Category.PHONE,
+    "notebook": Category.LAPTOP,
+    "refrigerator": Category.FRIDGE,
+    "nevera": Category.FRIDGE,
+    "lavadora": Category.WASHING_MACHINE,
+    "aire acondicionado": Category.AIR_CONDITIONER,
+    "microondas": Category.MICROWAVE,
+    "estufa": Category.STOVE,
+}
 
 class Condition(str, Enum):
     NEW = "New"
@@ -40,14 +42,20 @@ class Condition(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "Condition":
         """Convert string to condition, handling common variations"""
-        value = value.lower().strip()
-        mapping = {
-            "nuevo": cls.NEW,
-            "usado": cls.USED,
-            "reacondicionado": cls.REFURBISHED,
-            "refurbished": cls.REFURBISHED,
-        }
-        return mapping.get(value, next((c for c in cls if c.value.lower() == value), None))
+        return cls._LOOKUP.get(value.lower().strip())
+
+Condition._LOOKUP = {
+    **{c.value.lower(): c for c in Condition},
+    "nuevo": Condition.NEW,
+    "usado": Condition.USED,
+    "reacondicionado": Condition.REFURBISHED,
+    "refurbished": Condition.REFURBISHED,
+}
+
+def enum_value(value):
+    """Plain value of an enum member, other values unchanged"""
+    # Members compare and hash like their strings, but not inside numpy string arrays
+    return value.value if isinstance(value, Enum) else value
 
 class DealItem(BaseModel):
     title: str
@@ -69,14 +77,43 @@ class DealItem(BaseModel):
     review_count: Optional[int] = None
     scraped_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
     
-    @validator('price', 'original_price')
+    # Memoized search text, its tokens and the lower-cased brand, reset whenever a field is
+    # reassigned or replaced through model_copy(update=...); in-place edits are not tracked
+    _search_text: Optional[str] = PrivateAttr(default=None)
+    _tokens: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+    _brand_lower: Optional[str] = PrivateAttr(default=None)
+    
+    @field_validator('price', 'original_price')
+    @classmethod
     def validate_price(cls, v):
         if v is not None and v < 0:
             raise ValueError('Price cannot be negative')
         return v
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.model_fields:
+            self._clear_cache()
+    
+    def model_copy(self, *, update: Optional[Dict] = None, deep: bool = False) -> "DealItem":
+        # The copy takes over the private cache and its updated fields skip __setattr__
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy._clear_cache()
+        return copy
+    
+    def _clear_cache(self):
+        self._search_text = None
+        self._tokens = None
+        self._brand_lower = None
+    
     def to_search_text(self) -> str:
         """Convert item to searchable text for natural language search"""
+        if self._search_text is None:
+            self._search_text = self._build_search_text()
+        return self._search_text
+    
+    def _build_search_text(self) -> str:
         search_parts = [
             self.title,
             self.brand,
@@ -96,13 +133,39 @@ class DealItem(BaseModel):
             
         return " ".join(filter(None, search_parts)).lower()
     
+    @property
+    def brand_lower(self) -> str:
+        """Lower-cased brand for case-insensitive filtering"""
+        if self._brand_lower is None:
+            self._brand_lower = self.brand.lower()
+        return self._brand_lower
+    
+    @property
+    def tokens(self) -> FrozenSet[str]:
+        """Set of words in the search text"""
+        if self._tokens is None:
+            self._tokens = frozenset(self.to_search_text().split())
+        return self._tokens
+    
+    @staticmethod
+    def query_terms(query: str) -> FrozenSet[str]:
+        """Normalize a query once so it can be matched against many items"""
+        return frozenset(query.lower().split())
+    
     def matches_query(self, query: str, filters: Dict = None) -> bool:
         """Check if item matches search query and filters"""
-        # Natural language search
-        search_text = self.to_search_text()
-        if not all(term.lower() in search_text for term in query.split()):
-            return False
-            
+        return self.matches_terms(self.query_terms(query), filters)
+    
+    def matches_terms(self, terms: FrozenSet[str], filters: Dict = None) -> bool:
+        """Check if item matches pre-normalized query terms and filters"""
+        # Whole-word terms are set lookups; anything else may be a partial word
+        if not terms.issubset(self.tokens):
+            search_text = self.to_search_text()
+            if not all(term in search_text for term in terms - self.tokens):
+                return False
+        return self._filters_ok(filters)
+    
+    def _filters_ok(self, filters: Optional[Dict]) -> bool:
         # Apply filters if provided
         if filters:
             for key, value in filters.items():
@@ -1,27 +1,108 @@
 import asyncio
 import random
-from typing import Dict, List, Optional
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError
+from typing import List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError
 import aiohttp
 import logging
-from datetime import datetime, timedelta
 import time
 import os
 from dotenv import load_dotenv
+from core.utils import AsyncLRUCache
 
 # Load environment variables
 load_dotenv()
 
+_CHALLENGE_SELECTOR = 'div[class*="challenge"]'
+
+# Queued in place of a context whose replacement failed, so a caller already
+# waiting on the pool wakes up and retries creating it
+_MISSING_CONTEXT = object()
+
+def _minify_js(script: str) -> str:
+    """Strip indentation and line breaks; the scripts below terminate every statement explicitly"""
+    return "".join(line.strip() for line in script.splitlines())
+
+# Scroll down to a random point and back to top, with pauses, in one round-trip.
+# Scroll events from window.scrollTo are dispatched by the browser, so they are trusted.
+_HUMAN_SCROLL_JS = _minify_js("""
+async () => {
+    const sleep = (min, max) => new Promise(r => setTimeout(r, min + Math.random() * (max - min)));
+    window.scrollTo({top: Math.random() * document.body.scrollHeight, behavior: 'smooth'});
+    await sleep(500, 1000);
+    window.scrollTo({top: 0, behavior: 'smooth'});
+    await sleep(500, 1000);
+}
+""")
+
+# Browser-like request headers sent in stealth mode
+_STEALTH_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'DNT': '1',
+    'Sec-Ch-Ua': '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
+    'Sec-Ch-Ua-Mobile': '?0',
+    'Sec-Ch-Ua-Platform': '"Windows"'
+}
+
+# Stealth overrides, injected once per pooled context when the pool is seeded
+_STEALTH_JS = _minify_js("""
+Object.defineProperties(navigator, {
+    webdriver: {get: () => undefined},
+    plugins: {get: () => [1, 2, 3, 4, 5]},
+    languages: {get: () => ['en-US', 'en']},
+    platform: {get: () => 'Win32'},
+    hardwareConcurrency: {get: () => 8},
+    deviceMemory: {get: () => 8},
+    maxTouchPoints: {get: () => 0},
+    vendor: {get: () => 'Google Inc.'},
+    appVersion: {get: () => '5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'},
+    appName: {get: () => 'Netscape'},
+    appCodeName: {get: () => 'Mozilla'},
+    product: {get: () => 'Gecko'},
+    productSub: {get: () => '20030107'},
+    doNotTrack: {get: () => null},
+    connection: {get: () => ({effectiveType: '4g', rtt: 50, downlink: 10, saveData: false})}
+});
+""")
+
 class RequestManager:
-    def __init__(self, use_stealth: bool = True, use_proxy: bool = True):
+    def __init__(self, use_stealth: bool = True, use_proxy: bool = True, pool_size: int = 2,
+                 headless: bool = True):
         self.use_stealth = use_stealth
         self.use_proxy = use_proxy
+        self.headless = headless
         self.browser: Optional[Browser] = None
         self.proxies: List[str] = []
-        self.last_request_time = datetime.now()
+        self.last_request_time = 0.0  # time.monotonic() of the last request
         self.min_request_interval = 2  # seconds
         self.playwright = None
         
+        # Browser contexts are created once and reused across pages
+        self.pool_size = pool_size
+        self._contexts: List[BrowserContext] = []
+        self._context_pool: Optional[asyncio.Queue] = None
+        # Pooled contexts that closed or had a page crash; replaced instead of reused
+        self._broken_contexts = set()
+        self._init_lock = asyncio.Lock()
+        self._pool_lock = asyncio.Lock()
+        self._rate_limit_lock = asyncio.Lock()
+        
+        # Cookies (notably cf_clearance) are persisted here between runs
+        self.storage_state_path = os.getenv('PLAYWRIGHT_STATE_PATH', '.pw_state.json')
+        
+        # Plain HTTP client for pages that render without JavaScript
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Managers outlive single scrape() calls, so cached pages expire after a few minutes
+        self._html_cache = AsyncLRUCache(maxsize=256, ttl=300)
+        
         # Configure logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -42,9 +123,13 @@ class RequestManager:
         ]
 
     async def init_browser(self):
-        if self.browser is not None:
-            return
-            
+        # Scrapers share this manager concurrently, so only the first caller launches
+        async with self._init_lock:
+            if self.browser is not None:
+                return
+            await self._launch_browser()
+
+    async def _launch_browser(self):
         try:
             self.playwright = await async_playwright().start()
             browser_args = [
@@ -83,142 +168,213 @@ class RequestManager:
             else:
                 self.logger.warning("No proxy credentials found, running without proxy")
                 
+            if self.headless:
+                # New headless mode renders like headed Chrome, which keeps Cloudflare checks passing
+                browser_args.append('--headless=new')
+            
             self.browser = await self.playwright.chromium.launch(
-                headless=False,  # Set to False to bypass Cloudflare
+                headless=self.headless,
                 args=browser_args
             )
+            
+            # Pre-populate the context pool
+            self._context_pool = asyncio.Queue()
+            for _ in range(self.pool_size):
+                context = await self._new_context()
+                self._contexts.append(context)
+                self._context_pool.put_nowait(context)
         except Exception as e:
             self.logger.error(f"Error initializing browser: {str(e)}")
-            if self.playwright:
-                await self.playwright.stop()
+            await self.close()
             raise
 
+    async def _new_context(self) -> BrowserContext:
+        context_options = {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': random.choice(self.user_agents),
+            'ignore_https_errors': True,
+            'java_script_enabled': True,
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+            'geolocation': {'latitude': 18.4861, 'longitude': -69.9312},  # Santo Domingo coordinates
+            'permissions': ['geolocation'],
+            'color_scheme': 'light',
+            'reduced_motion': 'no-preference',
+            'forced_colors': 'none',
+            'accept_downloads': True
+        }
+        
+        if self.use_proxy and self.proxy_username and self.proxy_password:
+            context_options['proxy'] = {
+                'server': f'http://{self.proxy_host}:{self.proxy_port}',
+                'username': self.proxy_username,
+                'password': self.proxy_password
+            }
+        
+        if os.path.exists(self.storage_state_path):
+            context_options['storage_state'] = self.storage_state_path
+        
+        context = await self.browser.new_context(**context_options)
+        
+        # Add stealth scripts
+        await context.add_init_script(_STEALTH_JS)
+        context.on("close", lambda _: self._broken_contexts.add(context))
+        return context
+
+    async def _checkout_context(self) -> BrowserContext:
+        """Take a context from the pool, creating the ones whose replacement failed earlier"""
+        async with self._pool_lock:
+            if self._context_pool.empty() and len(self._contexts) < self.pool_size:
+                context = await self._new_context()
+                self._contexts.append(context)
+                return context
+        context = await self._context_pool.get()
+        if context is not _MISSING_CONTEXT:
+            return context
+        async with self._pool_lock:
+            try:
+                context = await self._new_context()
+            except BaseException:
+                # Pass the empty slot on so the next waiter retries instead of hanging
+                self._context_pool.put_nowait(_MISSING_CONTEXT)
+                raise
+            self._contexts.append(context)
+            return context
+
+    async def _replace_context(self, context: BrowserContext):
+        """Drop a broken context and put a fresh one in the pool in its place"""
+        if context in self._contexts:
+            self._contexts.remove(context)
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.error(f"Error closing broken browser context: {str(e)}")
+        self._broken_contexts.discard(context)
+        if self._context_pool is None:
+            return
+        try:
+            new_context = await self._new_context()
+        except Exception as e:
+            # Wake a waiting get_page() so it retries the creation itself
+            self.logger.error(f"Error replacing browser context: {str(e)}")
+            self._context_pool.put_nowait(_MISSING_CONTEXT)
+            return
+        self._contexts.append(new_context)
+        self._context_pool.put_nowait(new_context)
+
     async def get_page(self) -> Page:
+        """Check out a pooled context and open a new page in it.
+
+        Pages must be handed back with release_page() so the context returns to the pool.
+        """
         await self.init_browser()
+        context = await self._checkout_context()
         try:
-            context_options = {
-                'viewport': {'width': 1920, 'height': 1080},
-                'user_agent': random.choice(self.user_agents),
-                'ignore_https_errors': True,
-                'java_script_enabled': True,
-                'locale': 'en-US',
-                'timezone_id': 'America/New_York',
-                'geolocation': {'latitude': 18.4861, 'longitude': -69.9312},  # Santo Domingo coordinates
-                'permissions': ['geolocation'],
-                'color_scheme': 'light',
-                'reduced_motion': 'no-preference',
-                'forced_colors': 'none',
-                'accept_downloads': True
-            }
-            
-            if self.use_proxy and self.proxy_username and self.proxy_password:
-                context_options['proxy'] = {
-                    'server': f'http://{self.proxy_host}:{self.proxy_port}',
-                    'username': self.proxy_username,
-                    'password': self.proxy_password
-                }
-            
-            context = await self.browser.new_context(**context_options)
-            
-            # Add stealth scripts
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                Object.defineProperty(navigator, 'platform', {
-                    get: () => 'Win32'
-                });
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => 8
-                });
-                Object.defineProperty(navigator, 'deviceMemory', {
-                    get: () => 8
-                });
-                Object.defineProperty(navigator, 'maxTouchPoints', {
-                    get: () => 0
-                });
-                Object.defineProperty(navigator, 'vendor', {
-                    get: () => 'Google Inc.'
-                });
-                Object.defineProperty(navigator, 'appVersion', {
-                    get: () => '5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
-                });
-                Object.defineProperty(navigator, 'appName', {
-                    get: () => 'Netscape'
-                });
-                Object.defineProperty(navigator, 'appCodeName', {
-                    get: () => 'Mozilla'
-                });
-                Object.defineProperty(navigator, 'product', {
-                    get: () => 'Gecko'
-                });
-                Object.defineProperty(navigator, 'productSub', {
-                    get: () => '20030107'
-                });
-                Object.defineProperty(navigator, 'oscpu', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'buildID', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'doNotTrack', {
-                    get: () => null
-                });
-                Object.defineProperty(navigator, 'cookieEnabled', {
-                    get: () => true
-                });
-                Object.defineProperty(navigator, 'onLine', {
-                    get: () => true
-                });
-                Object.defineProperty(navigator, 'serviceWorker', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'connection', {
-                    get: () => ({
-                        effectiveType: '4g',
-                        rtt: 50,
-                        downlink: 10,
-                        saveData: false
-                    })
-                });
-            """)
-            
             page = await context.new_page()
-            
-            if self.use_stealth:
-                # Apply stealth settings
-                await page.set_extra_http_headers({
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0',
-                    'DNT': '1',
-                    'Sec-Ch-Ua': '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
-                    'Sec-Ch-Ua-Mobile': '?0',
-                    'Sec-Ch-Ua-Platform': '"Windows"'
-                })
-                
-            return page
         except Exception as e:
             self.logger.error(f"Error creating new page: {str(e)}")
+            await self._replace_context(context)
+            raise
+        except BaseException:
+            self._context_pool.put_nowait(context)
             raise
+        page.on("crash", lambda _: self._broken_contexts.add(context))
+        
+        if self.use_stealth:
+            # Apply stealth settings
+            try:
+                await page.set_extra_http_headers(_STEALTH_HEADERS)
+            except BaseException:
+                await self.release_page(page)
+                raise
+            
+        return page
+
+    async def release_page(self, page: Page):
+        """Close a page obtained from get_page() and return its context to the pool"""
+        context = page.context
+        try:
+            await page.close()
+        except Exception as e:
+            self.logger.error(f"Error closing page: {str(e)}")
+        if self._context_pool is None or context not in self._contexts:
+            return
+        if context in self._broken_contexts:
+            await self._replace_context(context)
+        else:
+            self._context_pool.put_nowait(context)
+
+    async def _has_cf_clearance(self, page: Page, url: str) -> bool:
+        cookies = await page.context.cookies(url)
+        return any(cookie['name'] == 'cf_clearance' for cookie in cookies)
+
+    async def _persist_clearance(self, page: Page):
+        """Share a freshly solved Cloudflare clearance with the pool and save it for later runs"""
+        try:
+            cookies = await page.context.cookies()
+            for context in self._contexts:
+                if context is not page.context:
+                    await context.add_cookies(cookies)
+            await page.context.storage_state(path=self.storage_state_path)
+        except Exception as e:
+            self.logger.error(f"Error persisting browser state: {str(e)}")
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        if self._http_session is None or self._http_session.closed:
+            headers = {'User-Agent': random.choice(self.user_agents)}
+            if self.use_stealth:
+                # aiohttp negotiates compression itself
+                headers.update({k: v for k, v in _STEALTH_HEADERS.items() if k != 'Accept-Encoding'})
+            self._http_session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+        return self._http_session
+
+    async def get_html(self, url: str) -> str:
+        """Fetch static HTML over plain HTTP without a browser, caching responses for a few minutes"""
+        return await self._html_cache.get(url, lambda: self._fetch_html(url))
+
+    async def _fetch_html(self, url: str) -> str:
+        await self._wait_for_rate_limit()
+        self.logger.info(f"Fetching URL over HTTP: {url}")
+        
+        request_options = {}
+        if self.use_proxy and self.proxy_username and self.proxy_password:
+            request_options['proxy'] = f'http://{self.proxy_host}:{self.proxy_port}'
+            request_options['proxy_auth'] = aiohttp.BasicAuth(self.proxy_username, self.proxy_password)
+        
+        max_retries = 3
+        for retry_count in range(1, max_retries + 1):
+            try:
+                async with self._get_http_session().get(url, **request_options) as response:
+                    response.raise_for_status()
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.error(f"Attempt {retry_count}/{max_retries} failed: {str(e)}")
+                if retry_count == max_retries:
+                    raise
+                await asyncio.sleep(2 * retry_count)  # Exponential backoff
 
     def add_proxy(self, proxy: str):
         self.proxies.append(proxy)
 
     async def close(self):
+        if self._http_session is not None:
+            try:
+                await self._http_session.close()
+            except Exception as e:
+                self.logger.error(f"Error closing HTTP session: {str(e)}")
+            self._http_session = None
+        self._html_cache.clear()
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                self.logger.error(f"Error closing browser context: {str(e)}")
+        self._contexts = []
+        self._context_pool = None
+        self._broken_contexts = set()
         if self.browser:
             try:
                 await self.browser.close()
@@ -233,37 +389,23 @@ class RequestManager:
                 self.logger.error(f"Error stopping playwright: {str(e)}")
 
     async def _wait_for_rate_limit(self):
-        elapsed = datetime.now() - self.last_request_time
-        if elapsed.total_seconds() < self.min_request_interval:
-            await asyncio.sleep(self.min_request_interval - elapsed.total_seconds())
-        self.last_request_time = datetime.now()
+        async with self._rate_limit_lock:
+            elapsed = time.monotonic() - self.last_request_time
+            if elapsed < self.min_request_interval:
+                await asyncio.sleep(self.min_request_interval - elapsed)
+            self.last_request_time = time.monotonic()
 
     async def _simulate_human_behavior(self, page: Page):
         """Simulate human-like behavior to avoid bot detection"""
-        # Random mouse movements
+        # Mouse movements go through page.mouse so they arrive as trusted input;
+        # MouseEvents dispatched from page script have isTrusted=false and are
+        # discarded by anti-bot checks. Each move is interpolated browser-side.
         for _ in range(3):
-            x = random.randint(0, 1920)
-            y = random.randint(0, 1080)
-            await page.mouse.move(x, y)
+            await page.mouse.move(random.randint(0, 1920), random.randint(0, 1080),
+                                  steps=random.randint(5, 15))
             await asyncio.sleep(random.uniform(0.1, 0.3))
         
-        # Random scrolling
-        await page.evaluate("""
-            window.scrollTo({
-                top: Math.random() * document.body.scrollHeight,
-                behavior: 'smooth'
-            });
-        """)
-        await asyncio.sleep(random.uniform(0.5, 1.0))
-        
-        # Scroll back to top
-        await page.evaluate("""
-            window.scrollTo({
-                top: 0,
-                behavior: 'smooth'
-            });
-        """)
-        await asyncio.sleep(random.uniform(0.5, 1.0))
+        await page.evaluate(_HUMAN_SCROLL_JS)
 
     async def get(self, url: str, **kwargs) -> Page:
         """Get a page from the given URL with rate limiting and error handling"""
@@ -281,13 +423,19 @@ class RequestManager:
                 # Set a longer timeout for the initial page load
                 await page.goto(url, wait_until="domcontentloaded", timeout=60000)
                 
+                # A cached cf_clearance cookie lets us skip the challenge entirely
+                if await self._has_cf_clearance(page, url):
+                    self.logger.info("Cloudflare clearance cookie present, skipping challenge wait")
+                    return page
+                
                 # Simulate human behavior
-                await self._simulate_human_behavior(page)
+                if self.use_stealth:
+                    await self._simulate_human_behavior(page)
                 
                 # Wait for Cloudflare challenge to complete
                 try:
-                    # Wait for the challenge to appear
-                    await page.wait_for_selector('div[class*="challenge"]', timeout=50000)
+                    # Probe briefly for the challenge; pages without one move on immediately
+                    await page.wait_for_selector(_CHALLENGE_SELECTOR, timeout=3000)
                     self.logger.info("Cloudflare challenge detected, waiting for completion...")
                     
                     # Try to find and click the checkbox
@@ -304,39 +452,38 @@ class RequestManager:
                                 )
                                 await asyncio.sleep(random.uniform(0.1, 0.3))
                                 await checkbox.click()
-                                await asyncio.sleep(2)
                     except TimeoutError:
                         self.logger.info("No checkbox found, continuing...")
                     
-                    # Wait for the challenge to complete (up to 30 seconds)
-                    for _ in range(30):
-                        if not await page.query_selector('div[class*="challenge"]'):
-                            self.logger.info("Cloudflare challenge completed")
-                            break
-                        await asyncio.sleep(1)
+                    # Resolves as soon as the challenge is removed from the DOM (up to 30 seconds)
+                    try:
+                        await page.wait_for_function(
+                            f"!document.querySelector('{_CHALLENGE_SELECTOR}')",
+                            timeout=30000
+                        )
+                        self.logger.info("Cloudflare challenge completed")
+                    except TimeoutError:
+                        self.logger.warning("Cloudflare challenge still present, continuing anyway")
                     
-                    # Additional wait to ensure page is fully loaded
-                    await asyncio.sleep(5)
+                    if await self._has_cf_clearance(page, url):
+                        await self._persist_clearance(page)
                     
                 except TimeoutError:
                     self.logger.info("No Cloudflare challenge detected, continuing...")
                 
-                # Wait for the main content to be visible
-                try:
-                    await page.wait_for_selector('body', timeout=50000)
-                except TimeoutError:
-                    self.logger.warning("Body selector not found, continuing anyway")
-                
-                # Simulate more human behavior after page load
-                await self._simulate_human_behavior(page)
-                
                 return page
                 
             except Exception as e:
                 retry_count += 1
                 self.logger.error(f"Attempt {retry_count}/{max_retries} failed: {str(e)}")
                 if page:
-                    await page.close()
+                    await self.release_page(page)
+                    page = None
                 if retry_count == max_retries:
                     raise
-                await asyncio.sleep(2 * retry_count)  # Exponential backoff
\ No newline at end of file
+                await asyncio.sleep(2 * retry_count)  # Exponential backoff
+            except BaseException:
+                # Cancelled mid-load: hand the context back to the pool before propagating
+                if page:
+                    await self.release_page(page)
+                raise
\ No newline at end of file
@@ -1,26 +1,118 @@
-from typing import List, Dict, Optional
-from core.data_models import DealItem
-import re
+from typing import List, Dict, Optional, Set
+from core.data_models import DealItem, enum_value
+import heapq
 from collections import defaultdict
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, scipy's sparse product is used instead
+    njit = None
+
+MIN_SIMILARITY = 0.1
+N_FEATURES = 2 ** 18
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _sparse_cos(data, indices, indptr, query, out):
+        """Dot every L2-normalized CSR row with a dense normalized query vector"""
+        for row in prange(out.shape[0]):
+            total = 0.0
+            for k in range(indptr[row], indptr[row + 1]):
+                total += data[k] * query[indices[k]]
+            out[row] = total
+else:
+    _sparse_cos = None
 
 class SearchEngine:
     def __init__(self):
-        self.vectorizer = TfidfVectorizer(
+        # Terms are hashed rather than kept in a vocabulary, so batches can be
+        # indexed incrementally; IDF weights are derived from document frequencies
+        self.hasher = HashingVectorizer(
             lowercase=True,
             stop_words='english',
-            ngram_range=(1, 2)
+            ngram_range=(1, 2),
+            n_features=N_FEATURES,
+            alternate_sign=False,
+            norm=None
         )
         self.items: List[DealItem] = []
         self.item_vectors = None
+        self._count_batches: List[sp.csr_matrix] = []
+        self._doc_freq = np.zeros(N_FEATURES, dtype=np.int64)
+        self._idf = np.zeros(N_FEATURES, dtype=np.float64)
+        # Filterable fields as parallel arrays, one entry per item
+        self._price = np.empty(0, dtype=np.float64)
+        self._brand = np.empty(0, dtype=object)
+        self._condition = np.empty(0, dtype=str)
+        self._category = np.empty(0, dtype=str)
+        self._location_lower = np.empty(0, dtype=str)
+        # Suggestion index: distinct 1-3 word phrases, their frequencies and a
+        # character trigram -> phrase ids inverted index
+        self._phrases: List[str] = []
+        self._phrase_counts: List[int] = []
+        self._phrase_ids: Dict[str, int] = {}
+        self._trigram_index: Dict[str, Set[int]] = defaultdict(set)
         
     def add_items(self, items: List[DealItem]):
-        """Add items to the search index"""
-        self.items = items
+        """Add items to the search index; repeated calls extend it"""
+        if not items:
+            return
+        # Search texts are computed once for both the hashed counts and the phrase index
         texts = [item.to_search_text() for item in items]
-        self.item_vectors = self.vectorizer.fit_transform(texts)
+        counts = self.hasher.transform(texts)
+        self.items.extend(items)
+        self._count_batches.append(counts)
+        self._doc_freq += np.bincount(counts.indices, minlength=N_FEATURES)
+        # Weighted vectors are rebuilt on the next query, since IDF depends on the whole index
+        self.item_vectors = None
+        self._append_filter_columns(items)
+        self._index_phrases(texts)
+        
+    def _ensure_item_vectors(self):
+        if self.item_vectors is not None:
+            return
+        if len(self._count_batches) > 1:
+            self._count_batches = [sp.vstack(self._count_batches, format="csr")]
+        # Smoothed IDF as in TfidfTransformer; unseen terms get no weight so they
+        # do not dilute the query norm
+        n_docs = len(self.items)
+        self._idf = np.where(
+            self._doc_freq > 0,
+            np.log((1 + n_docs) / (1 + self._doc_freq)) + 1.0,
+            0.0
+        )
+        self.item_vectors = normalize(self._count_batches[0] @ sp.diags(self._idf)).tocsr()
+        
+    def _append_filter_columns(self, items: List[DealItem]):
+        self._price = np.concatenate([
+            self._price,
+            np.fromiter((item.price for item in items), dtype=np.float64, count=len(items))
+        ])
+        self._brand = np.concatenate([self._brand, np.array([item.brand for item in items], dtype=object)])
+        self._condition = np.concatenate([self._condition, np.array([item.condition.value for item in items], dtype=str)])
+        self._category = np.concatenate([self._category, np.array([item.category.value for item in items], dtype=str)])
+        self._location_lower = np.concatenate([self._location_lower, np.array([item.location.lower() for item in items], dtype=str)])
+        
+    def _index_phrases(self, texts: List[str]):
+        phrase_ids = self._phrase_ids
+        for text in texts:
+            words = text.split()
+            for i in range(len(words)):
+                for j in range(i + 1, min(i + 4, len(words) + 1)):
+                    phrase = " ".join(words[i:j])
+                    phrase_id = phrase_ids.get(phrase)
+                    if phrase_id is None:
+                        phrase_id = len(self._phrases)
+                        phrase_ids[phrase] = phrase_id
+                        self._phrases.append(phrase)
+                        self._phrase_counts.append(0)
+                        for trigram in _trigrams(phrase):
+                            self._trigram_index[trigram].add(phrase_id)
+                    self._phrase_counts[phrase_id] += 1
         
     def search(self, query: str, filters: Optional[Dict] = None, limit: int = 50) -> List[DealItem]:
         """Search items using natural language query and optional filters"""
@@ -28,45 +120,76 @@ class SearchEngine:
             return []
             
         # Transform query
-        query_vector = self.vectorizer.transform([query])
+        self._ensure_item_vectors()
+        query_vector = normalize(self.hasher.transform([query]) @ sp.diags(self._idf))
         
         # Calculate similarity scores
-        similarities = cosine_similarity(query_vector, self.item_vectors).flatten()
+        similarities = self._similarities(query_vector)
+        
+        # Keep items above the minimum similarity threshold that pass the filters
+        mask = similarities > MIN_SIMILARITY
+        if filters:
+            mask &= self._filter_mask(filters)
         
-        # Get top matches
-        matches = []
-        for idx, score in enumerate(similarities):
-            item = self.items[idx]
-            if score > 0.1:  # Minimum similarity threshold
-                if not filters or item.matches_query("", filters):  # Apply filters if provided
-                    matches.append((score, item))
-                    
-        # Sort by relevance and return top results
-        matches.sort(reverse=True, key=lambda x: x[0])
-        return [item for score, item in matches[:limit]]
+        # Select the top results in linear time, then sort only those by relevance
+        candidates = np.flatnonzero(mask)
+        scores = similarities[candidates]
+        if limit < len(candidates):
+            top = np.argpartition(-scores, limit)[:limit]
+        else:
+            top = np.arange(len(candidates))
+        # Ties keep index order, as a stable sort over all candidates would
+        top = top[np.lexsort((candidates[top], -scores[top]))]
+        return [self.items[idx] for idx in candidates[top]]
+    
+    def _filter_mask(self, filters: Dict) -> np.ndarray:
+        """Vectorized equivalent of DealItem's filter checks over the whole index"""
+        mask = np.ones(len(self.items), dtype=bool)
+        for key, value in filters.items():
+            if key == "price_range":
+                if value.get("min"):
+                    mask &= self._price >= value["min"]
+                if value.get("max"):
+                    mask &= self._price <= value["max"]
+            elif key == "brand" and isinstance(value, list):
+                mask &= np.isin(self._brand, value)
+            elif key == "condition":
+                mask &= self._condition == enum_value(value)
+            elif key == "location":
+                mask &= np.char.find(self._location_lower, value.lower()) >= 0
+            elif key == "category":
+                mask &= self._category == enum_value(value)
+        return mask
+    
+    def _similarities(self, query_vector) -> np.ndarray:
+        """Cosine similarity of the query against every item; both sides are L2-normalized"""
+        if _sparse_cos is None:
+            return (self.item_vectors @ query_vector.T).toarray().ravel()
+        vectors = self.item_vectors
+        out = np.empty(vectors.shape[0], dtype=np.float64)
+        _sparse_cos(vectors.data, vectors.indices, vectors.indptr,
+                    query_vector.toarray().ravel(), out)
+        return out
     
     def get_suggestions(self, partial_query: str) -> List[str]:
         """Get search suggestions based on partial query"""
         if not self.items or len(partial_query) < 2:
             return []
             
-        # Extract common phrases from items matching partial query
-        matching_texts = []
-        for item in self.items:
-            text = item.to_search_text()
-            if partial_query.lower() in text:
-                matching_texts.append(text)
-                
-        # Extract frequent phrases
-        phrases = defaultdict(int)
-        for text in matching_texts:
-            words = text.split()
-            for i in range(len(words)):
-                for j in range(i + 1, min(i + 4, len(words) + 1)):
-                    phrase = " ".join(words[i:j])
-                    if partial_query.lower() in phrase.lower():
-                        phrases[phrase] += 1
-                        
-        # Return top suggestions
-        suggestions = sorted(phrases.items(), key=lambda x: x[1], reverse=True)
-        return [phrase for phrase, count in suggestions[:10]] 
\ No newline at end of file
+        # Candidate phrases share every trigram of the query; queries too short
+        # to have trigrams fall back to scanning the distinct phrases
+        partial_query = partial_query.lower()
+        trigrams = _trigrams(partial_query)
+        if trigrams:
+            postings = sorted((self._trigram_index.get(t, set()) for t in trigrams), key=len)
+            candidates = postings[0].intersection(*postings[1:])
+        else:
+            candidates = range(len(self._phrases))
+        matches = [pid for pid in candidates if partial_query in self._phrases[pid]]
+        
+        # Return the most frequent phrases, earliest seen first on ties
+        top = heapq.nsmallest(10, matches, key=lambda pid: (-self._phrase_counts[pid], pid))
+        return [self._phrases[pid] for pid in top]
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
@@ -0,0 +1,39 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+class AsyncLRUCache:
+    """Least-recently-used cache for coroutine results.
+
+    Concurrent misses on the same key share a single call, and failed calls are not cached.
+    With a ttl (seconds), entries older than that are fetched again.
+    """
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[asyncio.Future, float]]" = OrderedDict()
+
+    async def get(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and (self.ttl is None or now - entry[1] < self.ttl):
+            future = entry[0]
+            self._entries.move_to_end(key)
+        else:
+            future = asyncio.ensure_future(factory())
+            self._entries[key] = (future, now)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        try:
+            # Shielded so one cancelled waiter does not cancel the call for the others
+            return await asyncio.shield(future)
+        except Exception:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is future:
+                del self._entries[key]
+            raise
+
+    def clear(self):
+        self._entries.clear()
\ No newline at end of file
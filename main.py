@@ -12,6 +12,7 @@ sys.path.insert(0, str(project_root))
 from scrapers.electrodomesticos import ElectrodomesticosScraper
 from scrapers.plazalama import PlazaLamaScraper
 from core.data_models import DealItem, Condition
+from core.request_manager import RequestManager
 from pipelines.cleaning import clean_data
 from pipelines.storage import save_to_json
 from loguru import logger
@@ -29,31 +30,49 @@ SCRAPERS = {
     "plazalama": PlazaLamaScraper
 }
 
-async def scrape_all(filters: Dict) -> Dict[str, List[DealItem]]:
-    results = {}
-    
-    for site_name, scraper_class in SCRAPERS.items():
-        scraper = None
+async def _run_one(site_name: str, scraper_class, filters: Dict,
+                   request_manager: RequestManager, semaphore: asyncio.Semaphore):
+    async with semaphore:
         try:
-            scraper = scraper_class()
+            scraper = scraper_class(request_manager)
             if not _filters_are_supported(scraper, filters):
                 logger.warning(f"Filters are not supported for {site_name}")
-                continue
+                return None
                 
             site_results = await scraper.scrape(filters)
             logger.info(f"Scraped {len(site_results)} deals from {site_name}")
-            results[site_name] = clean_data(site_results)
+            return site_name, clean_data(site_results)
         except Exception as e:
             logger.error(f"Error scraping {site_name}: {str(e)}", exc_info=True)
+            return None
+
+async def scrape_all(filters: Dict, max_concurrency: int = len(SCRAPERS)) -> Dict[str, List[DealItem]]:
+    # Sites are scraped concurrently, so wall time is bound by the slowest site
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # All scrapers share one browser and its pool of contexts
+    request_manager = RequestManager(pool_size=max_concurrency)
+    try:
+        tasks = [
+            asyncio.create_task(_run_one(site_name, scraper_class, filters, request_manager, semaphore))
+            for site_name, scraper_class in SCRAPERS.items()
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await request_manager.close()
+    
+    results = {}
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            logger.error(f"Scraper task failed: {str(outcome)}")
             continue
-        finally:
-            if scraper and scraper.request_manager:
-                await scraper.request_manager.close()
+        if outcome is not None:
+            site_name, site_results = outcome
+            results[site_name] = site_results
     
     return results
 
 def _filters_are_supported(scraper, filters: Dict) -> bool:
-    supported = scraper.get_supported_filters()
+    supported = scraper.get_supported_filter_sets()
     
     for key, value in filters.items():
         # Check if the filter key is supported
@@ -70,16 +89,17 @@ def _filters_are_supported(scraper, filters: Dict) -> bool:
                 return False
             continue
             
-        # Handle list of values (e.g., brands)
-        if isinstance(supported_value, list):
-            # Convert single value to list for uniform handling
-            filter_values = value if isinstance(value, list) else [value]
+        # Handle sets of values (e.g., brands)
+        if isinstance(supported_value, frozenset):
+            # Convert single value to a set for uniform handling; Category and
+            # Condition members hash like their string values, so they match too
+            filter_values = set(value if isinstance(value, list) else [value])
             
             # Check if all provided values are supported
-            for val in filter_values:
-                if val not in supported_value:
-                    logger.warning(f"Value {val} not in supported values {supported_value} for filter {key} in {scraper.__class__.__name__}")
-                    return False
+            if not filter_values.issubset(supported_value):
+                unsupported = sorted(filter_values - supported_value, key=str)
+                logger.warning(f"Values {unsupported} not in supported values {sorted(supported_value, key=str)} for filter {key} in {scraper.__class__.__name__}")
+                return False
                     
         # Handle other types of values
         elif value != supported_value and supported_value != Any:
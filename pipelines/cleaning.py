@@ -1,13 +1,25 @@
 from core.data_models import DealItem
 from typing import List
-import re
+
+_BRAND_MAPPINGS = {
+    "Samsung": ["Samsung", "Smg"],
+    "LG": ["LG", "Lg", "Elgie"],
+    # Add more brand mappings
+}
+
+# Flattened variant -> standard brand lookup
+_BRAND_LOOKUP = {
+    variant: std_brand
+    for std_brand, variants in _BRAND_MAPPINGS.items()
+    for variant in variants
+}
 
 def clean_data(items: List[DealItem]) -> List[DealItem]:
     cleaned = []
     for item in items:
         try:
-            # Clean title
-            item.title = re.sub(r"\s+", " ", item.title).strip()
+            # Clean title, collapsing whitespace runs without the regex engine
+            item.title = " ".join(item.title.split())
             
             # Standardize brand names
             item.brand = _standardize_brand(item.brand)
@@ -20,12 +32,4 @@ def clean_data(items: List[DealItem]) -> List[DealItem]:
 
 def _standardize_brand(brand: str) -> str:
     brand = brand.strip().title()
-    mappings = {
-        "Samsung": ["Samsung", "Smg"],
-        "LG": ["LG", "Lg", "Elgie"],
-        # Add more brand mappings
-    }
-    for std_brand, variants in mappings.items():
-        if brand in variants:
-            return std_brand
-    return brand
\ No newline at end of file
+    return _BRAND_LOOKUP.get(brand, brand)
\ No newline at end of file
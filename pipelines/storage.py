@@ -1,18 +1,23 @@
-import json
+import orjson
 from datetime import datetime
 from typing import Dict, List
 from core.data_models import DealItem
 
+def _fast_dict(item: DealItem) -> dict:
+    """Read an item's already-validated fields directly, skipping the serializer schema walk"""
+    d = item.__dict__.copy()
+    d["category"] = d["category"].value
+    d["condition"] = d["condition"].value
+    return d
+
 def save_to_json(data: Dict[str, List[DealItem]], filename: str):
-    serializable_data = {}
-    for site, items in data.items():
-        serializable_data[site] = [item.dict() for item in items]
-    
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump({
+    # Items are converted lazily by orjson's default hook, so no intermediate lists are built.
+    # orjson emits UTF-8 bytes directly, so the file is written in binary mode
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps({
             "metadata": {
                 "generated_at": datetime.utcnow().isoformat(),
                 "total_deals": sum(len(v) for v in data.values())
             },
-            "data": serializable_data
-        }, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+            "data": data
+        }, default=_fast_dict, option=orjson.OPT_INDENT_2))
\ No newline at end of file
@@ -7,23 +7,139 @@ if __name__ == "__main__":
     project_root = Path(__file__).parent.parent.absolute()
     sys.path.insert(0, str(project_root))
 
-from core.base_scraper import BaseScraper
+from core.base_scraper import BaseScraper, PreparedFilters, PRICE_RE, infer_category
+from core.request_manager import RequestManager
 from core.data_models import DealItem, Category, Condition
-from typing import Dict, List, Union
+from typing import Dict, List, Optional
 import re
-from bs4 import BeautifulSoup
+from html import unescape
+from selectolax.lexbor import LexborHTMLParser
 import logging
 import asyncio
 
+# Product card classes across site layouts, matched in a single tree walk
+_PRODUCT_CLASSES = ('product-thumb', 'item-product', 'product-item')
+_PRODUCT_SELECTOR = ', '.join(f'div.{product_class}' for product_class in _PRODUCT_CLASSES)
+
+# Product link classes in priority order, with their selectors built once
+_URL_SELECTORS = tuple(
+    (url_class, f'a.{url_class}') for url_class in ('more-info', 'thumb', 'product-link')
+)
+
+# Fast mode: the page is split into tags with one regex pass instead of
+# building a tree, and fields are read off the tag list with the same
+# selectors _parse_product uses. Anything the tag list cannot reproduce
+# exactly (block markup inside a field, comments or raw-text elements in a
+# card, an element left unclosed) makes the whole page fall back to the
+# tree parser.
+_FAST_RAW_TAGS = ('script', 'style', 'textarea', 'title', 'template', 'noscript', 'iframe')
+_FAST_ATTRS = r'''(?:[^>"']|"[^"]*"|'[^']*')*'''
+_FAST_TOKEN_RE = re.compile(
+    r'<!--.*?-->|<[!?][^>]*>'
+    rf'|<({"|".join(_FAST_RAW_TAGS)})\b{_FAST_ATTRS}>.*?</\1\s*>'
+    rf'|<(/?)([a-zA-Z][^\s/>]*)({_FAST_ATTRS})>',
+    re.S | re.I
+)
+_FAST_ATTR_RE = re.compile(r'''([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?''')
+# Elements whose text() is just their text nodes joined; br/wbr/img have none
+_FAST_INLINE_TAGS = frozenset((
+    'a', 'abbr', 'b', 'bdi', 'bdo', 'cite', 'code', 'data', 'dfn', 'em', 'i', 'kbd',
+    'mark', 'q', 's', 'samp', 'small', 'span', 'strong', 'sub', 'sup', 'time', 'u', 'var'
+))
+_FAST_VOID_TAGS = frozenset(('br', 'wbr', 'img'))
+_FAST_MISMATCH = object()
+
+def _fast_tokenize(content: str) -> List[tuple]:
+    """(start, end, closing, tag, attrs) for every tag; tag is None for comments and raw-text elements"""
+    tokens = []
+    for match in _FAST_TOKEN_RE.finditer(content):
+        tag = match.group(3)
+        if tag is not None:
+            # An unterminated raw-text element is not read as markup either
+            tag = tag.lower()
+            if tag in _FAST_RAW_TAGS:
+                tag = None
+        tokens.append((match.start(), match.end(), bool(match.group(2)), tag, match.group(4)))
+    return tokens
+
+def _fast_attrs(attrs: str) -> Dict[str, str]:
+    """Attributes of a tag; like the HTML parser, the first of a repeated name wins"""
+    result = {}
+    for name, double_quoted, single_quoted, bare in _FAST_ATTR_RE.findall(attrs):
+        result.setdefault(name.lower(), unescape(double_quoted or single_quoted or bare))
+    return result
+
+def _fast_element_end(tokens: List[tuple], index: int) -> Optional[int]:
+    """Index just past the tag closing the element opened at tokens[index], or None"""
+    tag = tokens[index][3]
+    depth = 0
+    for position in range(index, len(tokens)):
+        _, _, closing, name, _ = tokens[position]
+        if name is None:
+            return None
+        if name == tag:
+            depth += -1 if closing else 1
+            if depth == 0:
+                return position + 1
+    return None
+
+def _fast_find(tokens: List[tuple], tag: str, class_name: Optional[str] = None,
+               start: int = 1, stop: Optional[int] = None) -> Optional[int]:
+    """Index of the first opening `tag` (with class_name in its class list), or None"""
+    for position in range(start, len(tokens) if stop is None else stop):
+        _, _, closing, name, attrs = tokens[position]
+        if name == tag and not closing and (
+                class_name is None or class_name in _fast_attrs(attrs).get('class', '').split()):
+            return position
+    return None
+
+def _fast_text(content: str, tokens: List[tuple], tag: str, class_name: Optional[str] = None,
+               start: int = 1, stop: Optional[int] = None):
+    """text() of the first matching element: None if absent, _FAST_MISMATCH unless it holds only inline markup"""
+    index = _fast_find(tokens, tag, class_name, start, stop)
+    if index is None:
+        return None
+    parts = []
+    open_tags = []
+    position = tokens[index][1]
+    for token_start, token_end, closing, name, _ in tokens[index + 1:]:
+        parts.append(unescape(content[position:token_start]))
+        position = token_end
+        if closing:
+            if open_tags:
+                if open_tags.pop() != name:
+                    return _FAST_MISMATCH
+            elif name == tokens[index][3]:
+                return ''.join(parts)
+            else:
+                return _FAST_MISMATCH
+        elif name in _FAST_INLINE_TAGS:
+            open_tags.append(name)
+        elif name not in _FAST_VOID_TAGS:
+            return _FAST_MISMATCH
+    return _FAST_MISMATCH
+
 class ElectrodomesticosScraper(BaseScraper):
     BASE_URL = "https://electrodomesticos.com.do"
     SUPPORTED_BRANDS = ["Samsung", "LG", "Whirlpool", "Mabe", "Frigidaire", "JVC", "Sony"]
+    # Category filter value -> site path
+    CATEGORY_PATHS = {
+        "TV": "/electronicos/tv-y-video",
+        "PHONE": "/electronicos/celulares",
+        "LAPTOP": "/electronicos/computadoras",
+        "FRIDGE": "/cocina/refrigeradores",
+        "WASHING_MACHINE": "/lavado/lavadoras",
+        "AIR_CONDITIONER": "/aires-y-abanicos/aires-acondicionados",
+        "MICROWAVE": "/cocina/microondas",
+        "STOVE": "/cocina/estufas"
+    }
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, request_manager: Optional[RequestManager] = None):
+        super().__init__(request_manager)
         self.logger = logging.getLogger(__name__)
-        # Set debug level for detailed logging
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(logging.DEBUG if self.debug else logging.INFO)
+        # Regex-only extraction without a parse tree; opt-in via SCRAPER_FAST_MODE=1
+        self.fast_mode = os.getenv('SCRAPER_FAST_MODE') == '1'
         
     @staticmethod
     def get_supported_filters() -> Dict:
@@ -35,137 +151,190 @@ class ElectrodomesticosScraper(BaseScraper):
             "location": ["Santo Domingo", "Santiago", "La Romana"]
         }
     
-    async def scrape(self, filters: Dict) -> List[DealItem]:
+    def _parse_content(self, content: str, filters: PreparedFilters) -> List[DealItem]:
+        """Parse the listing page and return the products matching the filters"""
+        if self.fast_mode:
+            results = self._parse_content_fast(content, filters)
+            if results is not None:
+                return results
+            self.logger.info("Fast mode did not match the page layout, falling back to full parsing")
+        
         results = []
+        results_append = results.append
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        tree = LexborHTMLParser(content)
+        self.logger.debug("HTML parsed with selectolax")
         
-        try:
-            # Build URL based on category only
-            url = self._build_url(filters)
-            self.logger.info(f"Starting scrape for URL: {url}")
-            
-            page = await self.request_manager.get(url)
-            self.logger.debug("Page fetched successfully")
-            
-            # Get the page content and log it for debugging
-            content = await page.content()
-            self.logger.debug(f"Page content length: {len(content)}")
-            self.logger.debug(f"First 1000 characters of content: {content[:1000]}")
-            
-            # Check if we're being redirected or blocked
-            current_url = page.url
-            self.logger.debug(f"Current URL after load: {current_url}")
-            
-            # Take a screenshot for debugging
-            await page.screenshot(path="debug_screenshot.png")
-            self.logger.debug("Screenshot saved as debug_screenshot.png")
-            
-            soup = BeautifulSoup(content, 'html.parser')
-            self.logger.debug("HTML parsed with BeautifulSoup")
-            
-            # Log all div classes to help identify the correct selectors
-            all_divs = soup.find_all('div', class_=True)
+        # Log all div classes to help identify the correct selectors
+        if debug:
             self.logger.debug("Found divs with classes:")
-            for div in all_divs:
-                self.logger.debug(f"Div class: {div.get('class')}")
-            
-            # Find all product items
-            products = soup.find_all('div', class_='product-thumb')
-            self.logger.info(f"Found {len(products)} products with class 'product-thumb'")
-            
-            if not products:
-                # Try alternative class names that might be present
-                self.logger.debug("No products found with 'product-thumb', trying alternative selectors...")
-                products = soup.find_all('div', class_='item-product')
-                self.logger.debug(f"Found {len(products)} products with class 'item-product'")
-                if not products:
-                    products = soup.find_all('div', class_='product-item')
-                    self.logger.debug(f"Found {len(products)} products with class 'product-item'")
-            
-            for idx, product in enumerate(products, 1):
-                try:
-                    self.logger.debug(f"Processing product {idx}/{len(products)}")
-                    self.logger.debug(f"Product HTML: {product}")
-                    
-                    item = self._parse_product(product)
-                    self.logger.debug(f"Parsed product: {item}")
-                    
-                    if self._matches_filters(item, filters):
-                        self.logger.debug(f"Product matches filters, adding to results")
-                        results.append(item)
-                    else:
-                        self.logger.debug(f"Product did not match filters")
-                except Exception as e:
-                    self.logger.error(f"Error parsing product {idx}: {str(e)}")
-                    self.logger.error(f"Product HTML that caused error: {product}")
-                    continue
-            
-            await page.close()
-            self.logger.info(f"Scraping completed. Found {len(results)} matching products")
-            
-        except Exception as e:
-            self.logger.error(f"Error during scraping: {str(e)}", exc_info=True)
-            
+            for div in tree.css('div[class]'):
+                self.logger.debug("Div class: %s", div.attributes.get('class'))
+        
+        # Find all product items; the site has used each of these card classes
+        products = tree.css(_PRODUCT_SELECTOR)
+        self.logger.info("Found %s products matching '%s'", len(products), _PRODUCT_SELECTOR)
+        
+        for product in products:
+            try:
+                if debug:
+                    self.logger.debug("Product HTML: %s", product.html)
+                
+                item = self._parse_product(product)
+                if debug:
+                    self.logger.debug("Parsed product: %s", item)
+                
+                if self._matches_filters(item, filters):
+                    self.logger.debug("Product matches filters, adding to results")
+                    results_append(item)
+                else:
+                    self.logger.debug("Product did not match filters")
+            except Exception as e:
+                self.logger.error("Error parsing product: %s", e)
+                self.logger.error("Product HTML that caused error: %s", product.html)
+                continue
+        
         return results
     
-    def _build_url(self, filters: Dict) -> str:
-        """Build URL based on filters"""
-        url = self.BASE_URL
+    def _parse_content_fast(self, content: str, filters: PreparedFilters) -> Optional[List[DealItem]]:
+        """Regex-only variant of _parse_content; returns None when the markup is not plain enough to read exactly"""
+        # The HTML parser normalises line endings before building text nodes
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        tokens = _fast_tokenize(content)
+        cards = []
+        for index, (_, _, closing, tag, attrs) in enumerate(tokens):
+            if tag != 'div' or closing:
+                continue
+            classes = _fast_attrs(attrs).get('class', '').split()
+            priority = min((_PRODUCT_CLASSES.index(c) for c in classes if c in _PRODUCT_CLASSES), default=None)
+            if priority is None:
+                continue
+            end = _fast_element_end(tokens, index)
+            if end is None:
+                return None
+            item = self._parse_product_fast(content, tokens[index:end])
+            if item is None:
+                return None
+            # selectolax returns a selector group's matches group by group,
+            # so order cards by their first listed class like the tree parser
+            cards.append((priority, item))
         
-        if "category" in filters:
-            category_path = self._get_category_path(filters["category"])
-            if category_path:
-                url += category_path
-                
-        return url
+        if not cards:
+            return None
+        self.logger.info("Fast mode extracted %s products", len(cards))
+        cards.sort(key=lambda card: card[0])
+        return [item for _, item in cards if self._matches_filters(item, filters)]
     
-    def _get_category_path(self, category: str) -> str:
-        """Map category to website path"""
-        category_paths = {
-            "TV": "/electronicos/tv-y-video",
-            "PHONE": "/electronicos/celulares",
-            "LAPTOP": "/electronicos/computadoras",
-            "FRIDGE": "/cocina/refrigeradores",
-            "WASHING_MACHINE": "/lavado/lavadoras",
-            "AIR_CONDITIONER": "/aires-y-abanicos/aires-acondicionados",
-            "MICROWAVE": "/cocina/microondas",
-            "STOVE": "/cocina/estufas"
-        }
-        return category_paths.get(category, "")
+    def _parse_product_fast(self, content: str, card: List[tuple]) -> Optional[DealItem]:
+        """Regex-only variant of _parse_product for one card's tags"""
+        # Title from the first h3, else the first link in the first div.name
+        title = _fast_text(content, card, 'h3')
+        if title is None:
+            name_index = _fast_find(card, 'div', 'name')
+            if name_index is not None:
+                name_end = _fast_element_end(card, name_index)
+                if name_end is None:
+                    return None
+                title = _fast_text(content, card, 'a', start=name_index + 1, stop=name_end)
+        
+        model = _fast_text(content, card, 'div', 'short-desc')
+        price_text = _fast_text(content, card, 'span', 'price')
+        tax_info = _fast_text(content, card, 'span', 'tax_included_notice')
+        if _FAST_MISMATCH in (title, model, price_text, tax_info):
+            return None
+        title = title.strip() if title else ""
+        model = model.strip() if model else ""
+        
+        price = 0.0
+        if price_text is not None:
+            try:
+                price = float(PRICE_RE.sub('', price_text.strip()))
+            except ValueError:
+                pass
+        
+        if model:
+            brand = model.split()[0]
+        elif title:
+            brand = title.split(',')[0].strip()
+        else:
+            brand = ""
+        
+        # Same link priority as _parse_product: known classes first, then any link
+        anchors = [_fast_attrs(attrs) for _, _, closing, tag, attrs in card[1:] if tag == 'a' and not closing]
+        url = None
+        for url_class, _ in _URL_SELECTORS:
+            for attrs in anchors:
+                if url_class in attrs.get('class', '').split():
+                    url = attrs.get('href') or ''
+                    break
+            if url is not None:
+                break
+        if not url:
+            url = next((attrs['href'] for attrs in anchors if 'href' in attrs), "")
+        if url and not url.startswith('http'):
+            url = self.BASE_URL + url
+        
+        image_url = None
+        image_index = _fast_find(card, 'img', 'img-responsive')
+        if image_index is not None:
+            image_url = _fast_attrs(card[image_index][4]).get('src') or ''
+        
+        specs = {}
+        if model:
+            specs['model'] = model
+        if tax_info is not None:
+            specs['tax_info'] = tax_info.strip()
+        # Text nodes lie between consecutive tags of the card
+        if any('Financiable' in unescape(content[card[position][1]:card[position + 1][0]])
+               for position in range(len(card) - 1)):
+            specs['financeable'] = 'true'
+        
+        return DealItem(
+            title=title,
+            price=price,
+            category=infer_category(title, url),
+            brand=brand,
+            condition=Condition.NEW,
+            location="Santo Domingo",
+            url=url,
+            image_url=image_url,
+            specifications=specs
+        )
     
     def _parse_product(self, product_elem) -> DealItem:
-        """Extract product information from HTML element"""
+        """Extract product information from a selectolax node"""
         self.logger.debug("Starting product parsing")
         
         # Get title from h3 tag
-        title_elem = product_elem.find('h3')
+        title_elem = product_elem.css_first('h3')
         if not title_elem:
             self.logger.debug("No h3 tag found, trying alternative title selectors")
-            title_elem = product_elem.find('div', class_='name')
+            title_elem = product_elem.css_first('div.name')
             if title_elem:
-                title_elem = title_elem.find('a')
+                title_elem = title_elem.css_first('a')
         
-        title = title_elem.text.strip() if title_elem else ""
-        self.logger.debug(f"Found title: {title}")
+        title = title_elem.text().strip() if title_elem else ""
+        self.logger.debug("Found title: %s", title)
         
         # Get model number from short-desc
-        model_elem = product_elem.find('div', class_='short-desc')
-        model = model_elem.text.strip() if model_elem else ""
-        self.logger.debug(f"Found model: {model}")
+        model_elem = product_elem.css_first('div.short-desc')
+        model = model_elem.text().strip() if model_elem else ""
+        self.logger.debug("Found model: %s", model)
         
         # Get price with detailed logging
         price = 0.0
-        price_elem = product_elem.find('span', class_='price')
+        price_elem = product_elem.css_first('span.price')
         if price_elem:
-            price_text = price_elem.text.strip()
-            self.logger.debug(f"Raw price text: {price_text}")
+            price_text = price_elem.text().strip()
+            self.logger.debug("Raw price text: %s", price_text)
             # Remove currency symbol (RD$) and convert to float
-            price_clean = re.sub(r'[^\d.]', '', price_text)
-            self.logger.debug(f"Cleaned price text: {price_clean}")
+            price_clean = PRICE_RE.sub('', price_text)
+            self.logger.debug("Cleaned price text: %s", price_clean)
             try:
                 price = float(price_clean)
-                self.logger.debug(f"Converted price: {price}")
+                self.logger.debug("Converted price: %s", price)
             except ValueError as e:
-                self.logger.error(f"Error converting price '{price_clean}' to float: {str(e)}")
+                self.logger.error("Error converting price '%s' to float: %s", price_clean, e)
         else:
             self.logger.debug("No price element found")
             
@@ -173,37 +342,37 @@ class ElectrodomesticosScraper(BaseScraper):
         brand = ""
         if model:
             brand = model.split()[0]
-            self.logger.debug(f"Brand extracted from model: {brand}")
+            self.logger.debug("Brand extracted from model: %s", brand)
         elif title:
             brand = title.split(',')[0].strip()
-            self.logger.debug(f"Brand extracted from title: {brand}")
+            self.logger.debug("Brand extracted from title: %s", brand)
             
         # Get product URL with validation
         url = ""
-        for url_class in ['more-info', 'thumb', 'product-link']:
-            url_elem = product_elem.find('a', class_=url_class)
+        for url_class, url_selector in _URL_SELECTORS:
+            url_elem = product_elem.css_first(url_selector)
             if url_elem:
-                url = url_elem.get('href', '')
-                self.logger.debug(f"Found URL with class '{url_class}': {url}")
+                url = url_elem.attributes.get('href') or ''
+                self.logger.debug("Found URL with class '%s': %s", url_class, url)
                 break
         
         if not url:
             # Try finding any link that contains the product URL
-            url_elem = product_elem.find('a', href=True)
+            url_elem = product_elem.css_first('a[href]')
             if url_elem:
-                url = url_elem.get('href', '')
-                self.logger.debug(f"Found URL from generic link: {url}")
+                url = url_elem.attributes.get('href') or ''
+                self.logger.debug("Found URL from generic link: %s", url)
         
         if url and not url.startswith('http'):
             url = self.BASE_URL + url
-            self.logger.debug(f"Complete URL: {url}")
+            self.logger.debug("Complete URL: %s", url)
             
         # Get image URL with validation
         image_url = None
-        img_elem = product_elem.find('img', class_='img-responsive')
+        img_elem = product_elem.css_first('img.img-responsive')
         if img_elem:
-            image_url = img_elem.get('src', '')
-            self.logger.debug(f"Found image URL: {image_url}")
+            image_url = img_elem.attributes.get('src') or ''
+            self.logger.debug("Found image URL: %s", image_url)
         else:
             self.logger.debug("No image element found")
             
@@ -212,22 +381,24 @@ class ElectrodomesticosScraper(BaseScraper):
         
         if model:
             specs['model'] = model
-            self.logger.debug(f"Added model to specs: {model}")
+            self.logger.debug("Added model to specs: %s", model)
             
-        tax_elem = product_elem.find('span', class_='tax_included_notice')
+        tax_elem = product_elem.css_first('span.tax_included_notice')
         if tax_elem:
-            specs['tax_info'] = tax_elem.text.strip()
-            self.logger.debug(f"Added tax info to specs: {specs['tax_info']}")
+            specs['tax_info'] = tax_elem.text().strip()
+            self.logger.debug("Added tax info to specs: %s", specs['tax_info'])
             
-        if 'Financiable' in product_elem.text:
-            specs['financeable'] = True
+        # Scan text nodes with early exit instead of joining the whole card's text
+        if any(node.tag == '-text' and 'Financiable' in (node.text_content or '')
+               for node in product_elem.traverse(include_text=True)):
+            specs['financeable'] = 'true'
             self.logger.debug("Product is financeable")
             
-        self.logger.debug(f"Final specs: {specs}")
+        self.logger.debug("Final specs: %s", specs)
         
         # Infer category from URL or title
-        category = self._infer_category(title, url)
-        self.logger.debug(f"Inferred category: {category}")
+        category = infer_category(title, url)
+        self.logger.debug("Inferred category: %s", category)
         
         # Create and return DealItem
         item = DealItem(
@@ -241,75 +412,9 @@ class ElectrodomesticosScraper(BaseScraper):
             image_url=image_url,
             specifications=specs
         )
-        self.logger.debug(f"Created DealItem: {item}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Created DealItem: %s", item)
         return item
-    
-    def _infer_category(self, title: str, url: str) -> Category:
-        """Infer product category from title and URL"""
-        # First try from URL
-        url_lower = url.lower()
-        for cat in Category:
-            if cat.value.lower() in url_lower:
-                return cat
-        
-        # Then try from title
-        title_lower = title.lower()
-        category_keywords = {
-            Category.TV: ["tv", "televisor", "monitor", "led", "smart tv"],
-            Category.PHONE: ["celular", "teléfono", "smartphone"],
-            Category.LAPTOP: ["laptop", "computadora", "notebook"],
-            Category.FRIDGE: ["nevera", "refrigerador"],
-            Category.WASHING_MACHINE: ["lavadora"],
-            Category.AIR_CONDITIONER: ["aire acondicionado"],
-            Category.MICROWAVE: ["microonda"],
-            Category.STOVE: ["estufa", "cocina"]
-        }
-        
-        for category, keywords in category_keywords.items():
-            if any(keyword in title_lower for keyword in keywords):
-                return category
-                
-        return Category.TV  # Default category
-    
-    def _matches_filters(self, item: DealItem, filters: Dict) -> bool:
-        """Check if item matches all specified filters"""
-        self.logger.debug(f"Checking filters for item: {item.title}")
-        self.logger.debug(f"Applied filters: {filters}")
-        
-        # Brand filter check
-        if "brand" in filters:
-            brand_filter = filters["brand"]
-            # Convert to list if single string
-            if isinstance(brand_filter, str):
-                brand_filter = [brand_filter]
-            
-            # Case insensitive brand comparison
-            if not any(b.lower() == item.brand.lower() for b in brand_filter):
-                self.logger.debug(f"Brand mismatch. Item brand: {item.brand}, Filter brands: {brand_filter}")
-                return False
-            else:
-                self.logger.debug(f"Brand match found for {item.brand}")
-                
-        if "condition" in filters and item.condition != filters["condition"]:
-            self.logger.debug(f"Condition mismatch. Item: {item.condition}, Filter: {filters['condition']}")
-            return False
-            
-        if "location" in filters and filters["location"].lower() not in item.location.lower():
-            self.logger.debug(f"Location mismatch. Item: {item.location}, Filter: {filters['location']}")
-            return False
-            
-        if "price_range" in filters:
-            min_price = filters["price_range"].get("min")
-            max_price = filters["price_range"].get("max")
-            if min_price is not None and item.price < min_price:
-                self.logger.debug(f"Price below minimum. Item: {item.price}, Min: {min_price}")
-                return False
-            if max_price is not None and item.price > max_price:
-                self.logger.debug(f"Price above maximum. Item: {item.price}, Max: {max_price}")
-                return False
-                
-        self.logger.debug("Item matches all filters")
-        return True
 
 # Test code when running this file directly
 if __name__ == "__main__":
@@ -327,9 +432,12 @@ if __name__ == "__main__":
         "location": "Santo Domingo"
     }
     
-    # Create and run scraper
-    scraper = ElectrodomesticosScraper()
-    results = asyncio.run(scraper.scrape(test_filters))
+    # Create and run scraper; the browser stays up for the whole run and is closed on exit
+    async def run_scraper():
+        async with ElectrodomesticosScraper() as scraper:
+            return await scraper.scrape(test_filters)
+    
+    results = asyncio.run(run_scraper())
     
     # Print results
     print(f"\nScraped {len(results)} products:")
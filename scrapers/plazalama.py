@@ -7,22 +7,68 @@ if __name__ == "__main__":
     project_root = Path(__file__).parent.parent.absolute()
     sys.path.insert(0, str(project_root))
 
-from typing import Dict, List, Union
-from core.base_scraper import BaseScraper
+from typing import Dict, List, Optional
+from core.base_scraper import BaseScraper, PreparedFilters, PRICE_RE, infer_category
+from core.request_manager import RequestManager
 from core.data_models import DealItem, Category, Condition
-import re
-from bs4 import BeautifulSoup
+from lxml import etree, html
 import logging
 import asyncio
 
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath step matching elements whose class list contains class_name"""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+# Compiled once; each call runs in lxml's C code
+_PRODUCTS_XPATH = etree.XPath('//' + _class_xpath('div', 'card-product-vertical'))
+# Same cards counted in the page, so the scroll loop needs no markup or parse
+_PRODUCT_COUNT_JS = "document.querySelectorAll('div.card-product-vertical').length"
+_TITLE_XPATH = etree.XPath('.//' + _class_xpath('p', 'prod__name'))
+_CROSSED_OUT_XPATH = etree.XPath('.//' + _class_xpath('div', 'prod-crossed-out__price'))
+_SPECIAL_PRICE_XPATH = etree.XPath('.//' + _class_xpath('p', 'base__price'))
+_PRICE_XPATH = etree.XPath('.//' + _class_xpath('span', 'price'))
+_URL_XPATHS = tuple(
+    (url_class, etree.XPath('.//' + _class_xpath('a', url_class)))
+    for url_class in ('more-info', 'thumb', 'product-link')
+)
+_ANY_LINK_XPATH = etree.XPath('.//a[@href]')
+_IMAGE_XPATH = etree.XPath('.//' + _class_xpath('img', 'prod__figure__img'))
+_OLD_PRICE_XPATH = etree.XPath('.//' + _class_xpath('p', 'prod-crossed-out__price__old'))
+_SAVINGS_XPATH = etree.XPath('.//' + _class_xpath('p', 'prod-crossed-out__price__special-off'))
+_LOW_STOCK_XPATH = etree.XPath('.//' + _class_xpath('div', 'low-stock-tag'))
+
+# Page text is handed to libxml2 as UTF-8 bytes with the encoding fixed up
+# front, so it is decoded exactly once and never re-sniffed from <meta>
+_UTF8_PARSER = html.HTMLParser(encoding='utf-8')
+
+def _parse_html(content: str):
+    """Parse Playwright's page text into an lxml tree"""
+    return html.fromstring(content.encode('utf-8'), parser=_UTF8_PARSER)
+
+def _first(xpath: etree.XPath, elem):
+    """First match of a compiled XPath under elem, or None"""
+    matches = xpath(elem)
+    return matches[0] if matches else None
+
 class PlazaLamaScraper(BaseScraper):
     BASE_URL = "https://plazalama.com.do/ca/electrodomesticos/4"
     SUPPORTED_BRANDS = ["Samsung", "LG", "Sony", "TCL", "Panasonic", "Whirlpool", "Mabe", "Oster"]
+    # Category filter value -> site path
+    CATEGORY_PATHS = {
+        "TV": "/electronica/televisores",
+        "PHONE": "/electronica/celulares",
+        "LAPTOP": "/electronica/computadoras",
+        "FRIDGE": "/electrodomesticos/refrigeracion",
+        "WASHING_MACHINE": "/electrodomesticos/lavado",
+        "AIR_CONDITIONER": "/electrodomesticos/climatizacion",
+        "MICROWAVE": "/electrodomesticos/cocina",
+        "STOVE": "/electrodomesticos/cocina"
+    }
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, request_manager: Optional[RequestManager] = None):
+        super().__init__(request_manager)
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(logging.DEBUG if self.debug else logging.INFO)
         
     @staticmethod
     def get_supported_filters() -> Dict:
@@ -34,172 +80,134 @@ class PlazaLamaScraper(BaseScraper):
             "location": ["Santo Domingo", "Santiago", "San Francisco"]
         }
     
-    async def scrape(self, filters: Dict) -> List[DealItem]:
-        results = []
+    async def _prepare_page(self, page):
+        """Scroll until the lazy-loaded listing stops growing or holds enough products"""
+        # Initial scroll height
+        last_height = await page.evaluate("document.body.scrollHeight")
         
-        try:
-            # Build URL based on category only
-            url = self._build_url(filters)
-            self.logger.info(f"Starting scrape for URL: {url}")
-            
-            page = await self.request_manager.get(url)
-            self.logger.debug("Page fetched successfully")
+        while True:
+            # Scroll to bottom
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            # Wait for new content to load
+            await asyncio.sleep(2)
             
-            # Initial scroll height
-            last_height = await page.evaluate("document.body.scrollHeight")
+            # Calculate new scroll height
+            new_height = await page.evaluate("document.body.scrollHeight")
             
-            while True:
-                # Scroll to bottom
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                # Wait for new content to load
-                await asyncio.sleep(2)
-                
-                # Calculate new scroll height
-                new_height = await page.evaluate("document.body.scrollHeight")
-                
-                # Break if no more content loaded
-                if new_height == last_height:
-                    break
-                    
-                last_height = new_height
+            # Break if no more content loaded
+            if new_height == last_height:
+                break
                 
-                # Check if we have enough products (optional limit)
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                if len(soup.find_all('div', class_='card-product-vertical')) > 100:
-                    break
-            
-            # Get final page content after all scrolling
-            content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Find all product items
-            products = soup.find_all('div', class_='card-product-vertical')
-            self.logger.info(f"Found {len(products)} products with class 'card-product-vertical'")
-            
-            for idx, product in enumerate(products, 1):
-                try:
-                    self.logger.debug(f"Processing product {idx}/{len(products)}")
-                    self.logger.debug(f"Product HTML: {product}")
-                    
-                    item = self._parse_product(product)
-                    self.logger.debug(f"Parsed product: {item}")
-                    
-                    if self._matches_filters(item, filters):
-                        self.logger.debug(f"Product matches filters, adding to results")
-                        results.append(item)
-                    else:
-                        self.logger.debug(f"Product did not match filters")
-                except Exception as e:
-                    self.logger.error(f"Error parsing product {idx}: {str(e)}")
-                    self.logger.error(f"Product HTML that caused error: {product}")
-                    continue
+            last_height = new_height
             
-            await page.close()
-            self.logger.info(f"Scraping completed. Found {len(results)} matching products")
-            
-        except Exception as e:
-            self.logger.error(f"Error during scraping: {str(e)}", exc_info=True)
-            
-        return results
+            # Check if we have enough products (optional limit)
+            if await page.evaluate(_PRODUCT_COUNT_JS) > 100:
+                break
     
-    def _build_url(self, filters: Dict) -> str:
-        """Build URL based on filters"""
-        url = self.BASE_URL
+    def _parse_content(self, content: str, filters: PreparedFilters) -> List[DealItem]:
+        """Parse the listing page and return the products matching the filters"""
+        results = []
+        results_append = results.append
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        tree = _parse_html(content)
         
-        if "category" in filters:
-            category_path = self._get_category_path(filters["category"])
-            if category_path:
-                url += category_path
+        # Find all product items
+        products = _PRODUCTS_XPATH(tree)
+        self.logger.info("Found %s products with class 'card-product-vertical'", len(products))
+        
+        for product in products:
+            try:
+                if debug:
+                    self.logger.debug("Product HTML: %s", html.tostring(product, encoding='unicode'))
                 
-        return url
-    
-    def _get_category_path(self, category: str) -> str:
-        """Map category to website path"""
-        category_paths = {
-            "TV": "/electronica/televisores",
-            "PHONE": "/electronica/celulares",
-            "LAPTOP": "/electronica/computadoras",
-            "FRIDGE": "/electrodomesticos/refrigeracion",
-            "WASHING_MACHINE": "/electrodomesticos/lavado",
-            "AIR_CONDITIONER": "/electrodomesticos/climatizacion",
-            "MICROWAVE": "/electrodomesticos/cocina",
-            "STOVE": "/electrodomesticos/cocina"
-        }
-        return category_paths.get(category, "")
+                item = self._parse_product(product)
+                if debug:
+                    self.logger.debug("Parsed product: %s", item)
+                
+                if self._matches_filters(item, filters):
+                    self.logger.debug("Product matches filters, adding to results")
+                    results_append(item)
+                else:
+                    self.logger.debug("Product did not match filters")
+            except Exception as e:
+                self.logger.error("Error parsing product: %s", e)
+                self.logger.error("Product HTML that caused error: %s", html.tostring(product, encoding='unicode'))
+                continue
+        
+        return results
     
     def _parse_product(self, product_elem) -> DealItem:
-        """Extract product information from HTML element"""
+        """Extract product information from an lxml product card"""
         self.logger.debug("Starting product parsing")
         
         # Get title from h3 tag
-        title_elem = product_elem.find('p', class_='prod__name')
-        title = title_elem.text.strip() if title_elem else ""
-        self.logger.debug(f"Found title: {title}")
+        title_elem = _first(_TITLE_XPATH, product_elem)
+        title = title_elem.text_content().strip() if title_elem is not None else ""
+        self.logger.debug("Found title: %s", title)
         
         # Get price with detailed logging
         price = 0.0
-        crossed_out_price = product_elem.find('div', class_='prod-crossed-out__price')
-        if crossed_out_price:
+        crossed_out_price = _first(_CROSSED_OUT_XPATH, product_elem)
+        if crossed_out_price is not None:
             # Get the special price (base__price)
-            price_elem = crossed_out_price.find('p', class_='base__price')
-            if price_elem:
-                price_text = price_elem.text.strip()
-                self.logger.debug(f"Raw price text: {price_text}")
+            price_elem = _first(_SPECIAL_PRICE_XPATH, crossed_out_price)
+            if price_elem is not None:
+                price_text = price_elem.text_content().strip()
+                self.logger.debug("Raw price text: %s", price_text)
                 # Remove currency symbol and convert to float
-                price_clean = re.sub(r'[^\d.]', '', price_text)
-                self.logger.debug(f"Cleaned price text: {price_clean}")
+                price_clean = PRICE_RE.sub('', price_text)
+                self.logger.debug("Cleaned price text: %s", price_clean)
                 try:
                     price = float(price_clean)
-                    self.logger.debug(f"Converted price: {price}")
+                    self.logger.debug("Converted price: %s", price)
                 except ValueError as e:
-                    self.logger.error(f"Error converting price '{price_clean}' to float: {str(e)}")
+                    self.logger.error("Error converting price '%s' to float: %s", price_clean, e)
         else:
             # Regular price
-            price_elem = product_elem.find('span', class_='price')
-            if price_elem:
-                price_text = price_elem.text.strip()
-                self.logger.debug(f"Raw price text: {price_text}")
-                price_clean = re.sub(r'[^\d.]', '', price_text)
-                self.logger.debug(f"Cleaned price text: {price_clean}")
+            price_elem = _first(_PRICE_XPATH, product_elem)
+            if price_elem is not None:
+                price_text = price_elem.text_content().strip()
+                self.logger.debug("Raw price text: %s", price_text)
+                price_clean = PRICE_RE.sub('', price_text)
+                self.logger.debug("Cleaned price text: %s", price_clean)
                 try:
                     price = float(price_clean)
-                    self.logger.debug(f"Converted price: {price}")
+                    self.logger.debug("Converted price: %s", price)
                 except ValueError as e:
-                    self.logger.error(f"Error converting price '{price_clean}' to float: {str(e)}")
+                    self.logger.error("Error converting price '%s' to float: %s", price_clean, e)
             else:
                 self.logger.debug("No price element found")
             
         # Get brand from title
         brand = title.split()[0] if title else ""
-        self.logger.debug(f"Brand extracted from title: {brand}")
+        self.logger.debug("Brand extracted from title: %s", brand)
             
         # Get product URL with validation
         url = ""
-        for url_class in ['more-info', 'thumb', 'product-link']:
-            url_elem = product_elem.find('a', class_=url_class)
-            if url_elem:
+        for url_class, url_xpath in _URL_XPATHS:
+            url_elem = _first(url_xpath, product_elem)
+            if url_elem is not None:
                 url = url_elem.get('href', '')
-                self.logger.debug(f"Found URL with class '{url_class}': {url}")
+                self.logger.debug("Found URL with class '%s': %s", url_class, url)
                 break
         
         if not url:
             # Try finding any link that contains the product URL
-            url_elem = product_elem.find('a', href=True)
-            if url_elem:
+            url_elem = _first(_ANY_LINK_XPATH, product_elem)
+            if url_elem is not None:
                 url = url_elem.get('href', '')
-                self.logger.debug(f"Found URL from generic link: {url}")
+                self.logger.debug("Found URL from generic link: %s", url)
         
         if url and not url.startswith('http'):
             url = self.BASE_URL + url
-            self.logger.debug(f"Complete URL: {url}")
+            self.logger.debug("Complete URL: %s", url)
             
         # Get image URL with validation
         image_url = None
-        img_elem = product_elem.find('img', class_='prod__figure__img')
-        if img_elem:
+        img_elem = _first(_IMAGE_XPATH, product_elem)
+        if img_elem is not None:
             image_url = img_elem.get('src', '')
-            self.logger.debug(f"Found image URL: {image_url}")
+            self.logger.debug("Found image URL: %s", image_url)
         else:
             self.logger.debug("No image element found")
             
@@ -207,29 +215,29 @@ class PlazaLamaScraper(BaseScraper):
         specs = {}
         
         # Add price information to specs
-        crossed_out_elem = product_elem.find('p', class_='prod-crossed-out__price__old')
-        if crossed_out_elem:
-            original_price = re.sub(r'[^\d.]', '', crossed_out_elem.text.strip())
+        crossed_out_elem = _first(_OLD_PRICE_XPATH, product_elem)
+        if crossed_out_elem is not None:
+            original_price = PRICE_RE.sub('', crossed_out_elem.text_content().strip())
             specs['original_price'] = original_price
-            self.logger.debug(f"Added original price to specs: {original_price}")
+            self.logger.debug("Added original price to specs: %s", original_price)
             
-        savings_elem = product_elem.find('p', class_='prod-crossed-out__price__special-off')
-        if savings_elem:
-            savings = re.sub(r'[^\d.]', '', savings_elem.text.strip())
+        savings_elem = _first(_SAVINGS_XPATH, product_elem)
+        if savings_elem is not None:
+            savings = PRICE_RE.sub('', savings_elem.text_content().strip())
             specs['savings'] = savings
-            self.logger.debug(f"Added savings to specs: {savings}")
+            self.logger.debug("Added savings to specs: %s", savings)
             
         # Check for low stock
-        low_stock_tag = product_elem.find('div', class_='low-stock-tag')
-        if low_stock_tag:
+        low_stock_tag = _first(_LOW_STOCK_XPATH, product_elem)
+        if low_stock_tag is not None:
             specs['stock_status'] = 'low_stock'
             self.logger.debug("Product is low in stock")
             
-        self.logger.debug(f"Final specs: {specs}")
+        self.logger.debug("Final specs: %s", specs)
         
         # Infer category from URL or title
-        category = self._infer_category(title, url)
-        self.logger.debug(f"Inferred category: {category}")
+        category = infer_category(title, url)
+        self.logger.debug("Inferred category: %s", category)
         
         # Create and return DealItem
         item = DealItem(
@@ -243,75 +251,9 @@ class PlazaLamaScraper(BaseScraper):
             image_url=image_url,
             specifications=specs
         )
-        self.logger.debug(f"Created DealItem: {item}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Created DealItem: %s", item)
         return item
-    
-    def _infer_category(self, title: str, url: str) -> Category:
-        """Infer product category from title and URL"""
-        # First try from URL
-        url_lower = url.lower()
-        for cat in Category:
-            if cat.value.lower() in url_lower:
-                return cat
-        
-        # Then try from title
-        title_lower = title.lower()
-        category_keywords = {
-            Category.TV: ["tv", "televisor", "monitor", "led", "smart tv"],
-            Category.PHONE: ["celular", "teléfono", "smartphone"],
-            Category.LAPTOP: ["laptop", "computadora", "notebook"],
-            Category.FRIDGE: ["nevera", "refrigerador"],
-            Category.WASHING_MACHINE: ["lavadora"],
-            Category.AIR_CONDITIONER: ["aire acondicionado"],
-            Category.MICROWAVE: ["microonda"],
-            Category.STOVE: ["estufa", "cocina"]
-        }
-        
-        for category, keywords in category_keywords.items():
-            if any(keyword in title_lower for keyword in keywords):
-                return category
-                
-        return Category.TV  # Default category
-    
-    def _matches_filters(self, item: DealItem, filters: Dict) -> bool:
-        """Check if item matches all specified filters"""
-        self.logger.debug(f"Checking filters for item: {item.title}")
-        self.logger.debug(f"Applied filters: {filters}")
-        
-        # Brand filter check
-        if "brand" in filters:
-            brand_filter = filters["brand"]
-            # Convert to list if single string
-            if isinstance(brand_filter, str):
-                brand_filter = [brand_filter]
-            
-            # Case insensitive brand comparison
-            if not any(b.lower() == item.brand.lower() for b in brand_filter):
-                self.logger.debug(f"Brand mismatch. Item brand: {item.brand}, Filter brands: {brand_filter}")
-                return False
-            else:
-                self.logger.debug(f"Brand match found for {item.brand}")
-                
-        if "condition" in filters and item.condition != filters["condition"]:
-            self.logger.debug(f"Condition mismatch. Item: {item.condition}, Filter: {filters['condition']}")
-            return False
-            
-        if "location" in filters and filters["location"].lower() not in item.location.lower():
-            self.logger.debug(f"Location mismatch. Item: {item.location}, Filter: {filters['location']}")
-            return False
-            
-        if "price_range" in filters:
-            min_price = filters["price_range"].get("min")
-            max_price = filters["price_range"].get("max")
-            if min_price is not None and item.price < min_price:
-                self.logger.debug(f"Price below minimum. Item: {item.price}, Min: {min_price}")
-                return False
-            if max_price is not None and item.price > max_price:
-                self.logger.debug(f"Price above maximum. Item: {item.price}, Max: {max_price}")
-                return False
-                
-        self.logger.debug("Item matches all filters")
-        return True
 
 # Test code when running this file directly
 if __name__ == "__main__":
@@ -329,9 +271,12 @@ if __name__ == "__main__":
         "location": "Santo Domingo"
     }
     
-    # Create and run scraper
-    scraper = PlazaLamaScraper()
-    results = asyncio.run(scraper.scrape(test_filters))
+    # Create and run scraper; the browser stays up for the whole run and is closed on exit
+    async def run_scraper():
+        async with PlazaLamaScraper() as scraper:
+            return await scraper.scrape(test_filters)
+    
+    results = asyncio.run(run_scraper())
     
     # Print results
     print(f"\nScraped {len(results)} products:")
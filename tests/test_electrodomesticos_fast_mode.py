@@ -0,0 +1,42 @@
+import re
+import unittest
+from pathlib import Path
+
+from core.base_scraper import PreparedFilters
+from scrapers.electrodomesticos import ElectrodomesticosScraper
+
+_FIXTURE = Path(__file__).parent / "fixtures" / "electrodomesticos_fast_mode.html"
+
+def _load_cases():
+    """name -> markup for every `<!-- case: name -->` section of the fixture"""
+    parts = re.split(r'<!-- case: (\S+) -->\n', _FIXTURE.read_text(encoding="utf-8"))
+    return dict(zip(parts[1::2], parts[2::2]))
+
+class FastModeTest(unittest.TestCase):
+    """SCRAPER_FAST_MODE must return exactly what the tree parser does, or fall back to it"""
+    
+    def setUp(self):
+        self.scraper = ElectrodomesticosScraper(request_manager=object())
+        self.filters = PreparedFilters.from_dict({})
+    
+    def _parse(self, content, fast_mode):
+        self.scraper.fast_mode = fast_mode
+        items = self.scraper._parse_content(content, self.filters)
+        return [item.model_dump(exclude={'scraped_at'}) for item in items]
+    
+    def test_fast_output_matches_tree_output(self):
+        for name, content in _load_cases().items():
+            with self.subTest(case=name):
+                self.assertEqual(self._parse(content, True), self._parse(content, False))
+    
+    def test_fast_mode_reads_plain_cards_itself(self):
+        for name, content in _load_cases().items():
+            with self.subTest(case=name):
+                fast = self.scraper._parse_content_fast(content, self.filters)
+                if name.startswith('fallback-'):
+                    self.assertIsNone(fast)
+                else:
+                    self.assertIsNotNone(fast)
+
+if __name__ == "__main__":
+    unittest.main()